@@ -2,13 +2,17 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Callable, Iterable, List, Optional, Sequence
 
 from .config import AgentConfig, AutomationSettings, UserProfile
-from .job_sources import JobPosting, JobQuery, JobSource
+from .job_sources import JobPosting, JobQuery, JobSource, search_async
+from .retrieval.faiss_index import SemanticIndex
 from .scoring import JobScore, ResumeScorer
+from .scoring_cache import ScoreCache
+from .utils.cache import default_cache_dir
 from .utils.resume_loader import load_resume_text
 
 
@@ -25,12 +29,17 @@ class ApplicationResult:
 class AutoApplyAgent:
     """High level interface for the auto-apply workflow."""
 
+    #: Corpora larger than this are narrowed with the semantic index before scoring.
+    semantic_prefilter_threshold = 500
+    semantic_prefilter_k = 100
+
     def __init__(
         self,
         config: AgentConfig,
         job_sources: Sequence[JobSource],
         automation_factory: Optional[Callable[[AgentConfig], "AutomationRunner"]] = None,
         resume_text: Optional[str] = None,
+        score_cache: Optional[ScoreCache] = None,
     ) -> None:
         self.config = config
         self.job_sources = list(job_sources)
@@ -38,8 +47,12 @@ class AutoApplyAgent:
             lambda cfg: AutomationRunner(cfg.automation)
         )
         self._resume_text = resume_text
+        self.score_cache = score_cache
         self._scorer: Optional[ResumeScorer] = None
+        self._semantic_index: Optional[SemanticIndex] = None
         self._applied_ids: set[str] = set()
+        # (resume_hash, job id) -> (composite, keyword, skills); spares re-ranking rescoring.
+        self._score_memo: dict[tuple[str, str], tuple[float, float, float]] = {}
 
     @property
     def resume_text(self) -> str:
@@ -57,78 +70,189 @@ class AutoApplyAgent:
 
     def discover_jobs(self) -> List[JobPosting]:
         """Collect jobs from all sources respecting freshness buckets."""
-        all_jobs: dict[str, JobPosting] = {}
+        return asyncio.run(self.discover_jobs_async())
+
+    async def discover_jobs_async(self) -> List[JobPosting]:
+        """Collect jobs from all sources, running the searches concurrently.
+
+        Freshness buckets are nested windows, so each (location, source) pair is
+        queried once for the widest window and the results are bucketed locally
+        to keep the freshest jobs first.
+        """
         search_prefs = self.config.search
         locations = list(search_prefs.locations) or [None]
-        excluded_companies = {company.lower() for company in search_prefs.exclude_companies}
-        for bucket in search_prefs.freshness_buckets:
-            effective_age = min(bucket, search_prefs.max_age_days)
-            for location in locations:
-                query = JobQuery(
-                    keywords=search_prefs.keywords,
-                    location=location,
-                    remote_only=search_prefs.remote_only,
-                    posted_within_days=effective_age,
-                )
-                for source in self.job_sources:
-                    try:
-                        jobs = source.search(query, limit=search_prefs.limit_per_bucket)
-                    except Exception as exc:  # pragma: no cover - network error path
-                        print(f"Failed to fetch jobs from {source.name}: {exc}")
-                        continue
-                    for job in jobs:
-                        if job.id in all_jobs:
-                            continue
-                        company_name = (job.company or "").lower()
-                        if company_name in excluded_companies:
-                            continue
-                        if not self._is_within_age(job, search_prefs.max_age_days):
-                            continue
-                        all_jobs[job.id] = job
-        return list(all_jobs.values())
-
-    def _is_within_age(self, job: JobPosting, max_age: Optional[int]) -> bool:
-        if max_age is None:
-            return True
+        excluded_companies = frozenset(
+            company.lower() for company in search_prefs.exclude_companies
+        )
+        buckets = [
+            min(bucket, search_prefs.max_age_days) for bucket in search_prefs.freshness_buckets
+        ]
+        limit = search_prefs.limit_per_bucket * len(buckets)
+        tasks: List[tuple[JobQuery, JobSource]] = []
+        for location in locations:
+            query = JobQuery(
+                keywords=search_prefs.keywords,
+                location=location,
+                remote_only=search_prefs.remote_only,
+                posted_within_days=max(buckets),
+            )
+            for source in self.job_sources:
+                tasks.append((query, source))
+
+        semaphore = asyncio.Semaphore(search_prefs.max_concurrent_requests)
+
+        async def run(query: JobQuery, source: JobSource) -> List[JobPosting]:
+            async with semaphore:
+                return await search_async(source, query, limit=limit)
+
+        results = await asyncio.gather(
+            *(run(query, source) for query, source in tasks), return_exceptions=True
+        )
+        fetched: List[JobPosting] = []
+        for (_, source), jobs in zip(tasks, results):
+            if isinstance(jobs, BaseException):  # pragma: no cover - network error path
+                print(f"Failed to fetch jobs from {source.name}: {jobs}")
+                continue
+            fetched.extend(jobs)
+
         now = datetime.now(timezone.utc)
-        published = job.published_at
-        if published.tzinfo is None:
-            published = published.replace(tzinfo=timezone.utc)
-        return (now - published).days <= max_age
+
+        def age_days(job: JobPosting) -> int:
+            published = job.published_at
+            if published.tzinfo is None:
+                published = published.replace(tzinfo=timezone.utc)
+            return (now - published).days
+
+        seen: set[str] = set()
+        bucketed: List[tuple[int, JobPosting]] = []
+        for job in fetched:
+            if job.id in seen:
+                continue
+            company_name = (job.company or "").lower()
+            if company_name in excluded_companies:
+                continue
+            age = age_days(job)
+            bucket_index = next(
+                (index for index, bucket in enumerate(buckets) if age <= bucket), None
+            )
+            if bucket_index is None:
+                continue
+            seen.add(job.id)
+            bucketed.append((bucket_index, job))
+        # Stable sort: freshest bucket first, source order preserved within a bucket.
+        bucketed.sort(key=lambda item: item[0])
+        return [job for _, job in bucketed]
+
+    @property
+    def resume_hash(self) -> str:
+        """Key identifying the resume, skills and metric that scores were computed with."""
+        digest = hashlib.sha1(self.resume_text.encode("utf-8"))
+        digest.update("\0".join(sorted(self.config.user.skills)).encode("utf-8"))
+        digest.update(f"\0{self.scorer.metric}".encode("utf-8"))
+        return digest.hexdigest()[:16]
 
     def rank_jobs(self, jobs: Iterable[JobPosting]) -> List[JobScore]:
-        scores = [self.scorer.score(job) for job in jobs]
+        jobs = list(jobs)
+        if len(jobs) > self.semantic_prefilter_threshold:
+            jobs = self._semantic_prefilter(jobs)
+        resume_hash = self.resume_hash
+        memo = self._score_memo
+        misses = [job for job in jobs if (resume_hash, job.id) not in memo]
+        if self.score_cache is None:
+            fresh = self.scorer.score_batch(misses)
+        else:
+            fresh = self._score_with_cache(misses, self.score_cache, resume_hash)
+        for score in fresh:
+            memo[(resume_hash, score.job.id)] = (
+                score.composite,
+                score.keyword_overlap,
+                score.skills_overlap,
+            )
+        scores = [_job_score(job, memo[(resume_hash, job.id)]) for job in jobs]
         scores.sort(key=lambda score: (score.composite, score.job.published_at), reverse=True)
         return scores
 
+    def _score_with_cache(
+        self, jobs: List[JobPosting], cache: ScoreCache, resume_hash: str
+    ) -> List[JobScore]:
+        cached = cache.get_many(resume_hash, [job.id for job in jobs])
+        misses = [job for job in jobs if job.id not in cached]
+        scores = self.scorer.score_batch(misses)
+        cache.put_many(resume_hash, scores)
+        scores.extend(_job_score(job, cached[job.id]) for job in jobs if job.id in cached)
+        return scores
+
+    def _semantic_prefilter(self, jobs: List[JobPosting]) -> List[JobPosting]:
+        """Keep the postings nearest to the resume, or all of them if unavailable."""
+        try:
+            if self._semantic_index is None:
+                self._semantic_index = SemanticIndex(cache_dir=default_cache_dir() / "semantic")
+            candidates = self._semantic_index.search(
+                self.resume_text, jobs, k=self.semantic_prefilter_k
+            )
+            self._semantic_index.save()
+        except Exception as exc:
+            # Missing extras, an unreachable model download or a corrupt index cache
+            # must not break ranking: the prefilter is only an optimisation.
+            print(f"Semantic prefilter skipped: {exc}")
+            return jobs
+        return candidates or jobs
+
     async def apply(self, limit: Optional[int] = None) -> List[ApplicationResult]:
-        jobs = self.rank_jobs(self.discover_jobs())
-        results: List[ApplicationResult] = []
-        if not jobs:
-            return results
-        async with self.automation_factory(self.config) as automation:
-            for index, score in enumerate(jobs):
-                if limit is not None and index >= limit:
-                    break
-                job = score.job
-                if job.id in self._applied_ids:
-                    continue
-                attempts = 0
-                success = False
-                message = ""
-                while attempts < self.config.automation.max_attempts_per_job and not success:
-                    attempts += 1
-                    success, message = await automation.apply_to_job(
-                        job, self.config.user, self.config.resume.path
-                    )
-                    if not success:
-                        await asyncio.sleep(0.5)
-                self._applied_ids.add(job.id)
-                results.append(
-                    ApplicationResult(job=job, success=success, attempts=attempts, message=message)
+        jobs = self.rank_jobs(await self.discover_jobs_async())
+        if limit is not None:
+            jobs = jobs[:limit]
+        # Claim jobs up front so a concurrent apply() call cannot pick them up too.
+        pending = [score.job for score in jobs if score.job.id not in self._applied_ids]
+        if not pending:
+            return []
+        self._applied_ids.update(job.id for job in pending)
+        settings = self.config.automation
+        semaphore = asyncio.Semaphore(settings.concurrency)
+        attempted: set[str] = set()
+
+        try:
+            async with self.automation_factory(self.config) as automation:
+
+                async def run(job: JobPosting) -> ApplicationResult:
+                    async with semaphore:
+                        attempted.add(job.id)
+                        result = await self._apply_to_job(automation, job)
+                        await asyncio.sleep(settings.cooldown_between_jobs)
+                        return result
+
+                # gather returns results in rank order regardless of completion order.
+                return list(await asyncio.gather(*(run(job) for job in pending)))
+        except BaseException:
+            # Release jobs that were never attempted, e.g. when the browser fails to
+            # launch, so a later apply() can pick them up again.
+            self._applied_ids.difference_update(
+                job.id for job in pending if job.id not in attempted
+            )
+            raise
+
+    async def _apply_to_job(self, automation, job: JobPosting) -> ApplicationResult:
+        attempts = 0
+        success = False
+        message = ""
+        while attempts < self.config.automation.max_attempts_per_job and not success:
+            attempts += 1
+            # Errors such as navigation timeouts fail this attempt only, so sibling
+            # applications running under gather() are left to finish.
+            try:
+                success, message = await automation.apply_to_job(
+                    job, self.config.user, self.config.resume.path
                 )
-                await asyncio.sleep(self.config.automation.cooldown_between_jobs)
-        return results
+            except Exception as exc:
+                success, message = False, str(exc) or type(exc).__name__
+            if not success:
+                await asyncio.sleep(0.5)
+        return ApplicationResult(job=job, success=success, attempts=attempts, message=message)
+
+
+def _job_score(job: JobPosting, row: tuple[float, float, float]) -> JobScore:
+    composite, keyword, skills = row
+    return JobScore(job=job, skills_overlap=skills, keyword_overlap=keyword, composite=composite)
 
 
 class AutomationRunner:
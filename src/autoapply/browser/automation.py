@@ -17,6 +17,29 @@ from ..job_sources import JobPosting
 class BrowserAutomation:
     """Navigate job pages and attempt to complete the application flow."""
 
+    # Alternatives are resolved as a single locator per lookup. CSS alternatives
+    # are comma-joined; other selector engines are combined with ``Locator.or_``.
+    # Click targets are tiers tried in priority order: a union matches in DOM
+    # order, so generic role matches (e.g. "Apply filters") get their own lower
+    # tier, and a failed click falls through to the next tier.
+    _APPLY_SELECTORS = (
+        ("text=/apply now/i", "text=/quick apply/i", "text=/submit application/i"),
+        ("role=button[name=/apply/i]",),
+    )
+    _SUBMIT_SELECTORS = (
+        ("button[type='submit'], input[type='submit']",),
+        ("role=button[name=/submit/i]",),
+    )
+    _CONTACT_SELECTORS = {
+        field: (
+            f"input[name*='{field}' i], "
+            f"input[placeholder*='{field}' i], "
+            f"input[aria-label*='{field}' i]"
+        )
+        for field in ("name", "email", "phone")
+    }
+    _LOCATION_SELECTOR = "input[name*='city' i], input[placeholder*='location' i]"
+
     def __init__(
         self,
         settings: AutomationSettings,
@@ -27,23 +50,15 @@ class BrowserAutomation:
         self._playwright_manager = None
         self._playwright = None
         self._browser = None
-        self._context = None
-        self._page = None
 
     async def __aenter__(self) -> "BrowserAutomation":
         async_playwright = self._require_playwright()
         self._playwright_manager = async_playwright()
         self._playwright = await self._playwright_manager.__aenter__()
         self._browser = await self._playwright.chromium.launch(headless=self.settings.headless)
-        self._context = await self._browser.new_context()
-        self._page = await self._context.new_page()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        if self._page:
-            await self._page.close()
-        if self._context:
-            await self._context.close()
         if self._browser:
             await self._browser.close()
         if self._playwright_manager:
@@ -52,50 +67,45 @@ class BrowserAutomation:
     async def apply_to_job(
         self, job: JobPosting, user: UserProfile, resume_path: Path
     ) -> Tuple[bool, str]:
-        """Attempt to apply for a job posting."""
-        if not self._page:
+        """Attempt to apply for a job posting.
+
+        Each application runs in a fresh browser context so cookies, storage and
+        crashed pages never leak between jobs, while the browser itself is shared.
+        """
+        if not self._browser:
             raise RuntimeError("BrowserAutomation must be used as an async context manager")
-        url = job.apply_url or job.url
-        await self._page.goto(url, wait_until="domcontentloaded")
-        await asyncio.sleep(self.settings.wait_after_navigation)
-
-        clicked = await self._click_apply_button()
-        if not clicked:
-            return False, "Apply button not located"
-
-        await asyncio.sleep(0.5)
-        await self._upload_resume(resume_path)
-        await self._populate_contact_details(user)
-        submitted = await self._submit_if_possible()
-        return submitted, "Application submitted" if submitted else "Form not submitted"
-
-    async def _click_apply_button(self) -> bool:
-        assert self._page
-        candidates = [
-            "text=/apply now/i",
-            "text=/quick apply/i",
-            "text=/submit application/i",
-            "role=button[name=/apply/i]",
-        ]
-        for selector in candidates:
-            locator = self._page.locator(selector)
-            if await locator.count():
-                try:
-                    await locator.first.click()
-                    return True
-                except Exception:
-                    continue
-        screenshot_bytes = await self._page.screenshot(full_page=True)
+        context = await self._browser.new_context()
+        try:
+            page = await context.new_page()
+            url = job.apply_url or job.url
+            await page.goto(url, wait_until="domcontentloaded")
+            await asyncio.sleep(self.settings.wait_after_navigation)
+
+            clicked = await self._click_apply_button(page)
+            if not clicked:
+                return False, "Apply button not located"
+
+            await asyncio.sleep(0.5)
+            await self._upload_resume(page, resume_path)
+            await self._populate_contact_details(page, user)
+            submitted = await self._submit_if_possible(page)
+            return submitted, "Application submitted" if submitted else "Form not submitted"
+        finally:
+            await context.close()
+
+    async def _click_apply_button(self, page) -> bool:
+        if await self._click_first(page, self._APPLY_SELECTORS):
+            return True
+        screenshot_bytes = await page.screenshot(full_page=True)
         image = Image.open(io.BytesIO(screenshot_bytes))
         match = self.button_locator.find_best_match(image)
         if not match:
             return False
-        await self._page.mouse.click(match.position[0], match.position[1])
+        await page.mouse.click(match.position[0], match.position[1])
         return True
 
-    async def _upload_resume(self, resume_path: Path) -> bool:
-        assert self._page
-        file_inputs = self._page.locator("input[type='file']")
+    async def _upload_resume(self, page, resume_path: Path) -> bool:
+        file_inputs = page.locator("input[type='file']")
         if await file_inputs.count():
             try:
                 await file_inputs.first.set_input_files(str(resume_path))
@@ -104,9 +114,7 @@ class BrowserAutomation:
                 return False
         return False
 
-    async def _populate_contact_details(self, user: UserProfile) -> None:
-        if not self._page:
-            return
+    async def _populate_contact_details(self, page, user: UserProfile) -> None:
         mapping = {
             "name": user.full_name,
             "email": user.email,
@@ -115,52 +123,47 @@ class BrowserAutomation:
         for field, value in mapping.items():
             if not value:
                 continue
-            selectors = [
-                f"input[name*='{field}' i]",
-                f"input[placeholder*='{field}' i]",
-                f"input[aria-label*='{field}' i]",
-            ]
-            await self._fill_first_available(selectors, value)
+            await self._fill_first_available(page, self._CONTACT_SELECTORS[field], value)
 
         if user.location:
-            await self._fill_first_available(
-                [
-                    "input[name*='city' i]",
-                    "input[placeholder*='location' i]",
-                ],
-                user.location,
-            )
-
-    async def _fill_first_available(self, selectors, value: str) -> bool:
-        assert self._page
-        for selector in selectors:
-            locator = self._page.locator(selector)
-            if await locator.count():
-                try:
-                    await locator.first.fill(value)
-                    return True
-                except Exception:
-                    continue
+            await self._fill_first_available(page, self._LOCATION_SELECTOR, user.location)
+
+    async def _fill_first_available(self, page, selector: str, value: str) -> bool:
+        locator = self._locate(page, selector)
+        if await locator.count():
+            try:
+                await locator.fill(value)
+                return True
+            except Exception:
+                return False
+        return False
+
+    async def _submit_if_possible(self, page) -> bool:
+        if await self._click_first(page, self._SUBMIT_SELECTORS):
+            await asyncio.sleep(1)
+            return True
         return False
 
-    async def _submit_if_possible(self) -> bool:
-        assert self._page
-        selectors = [
-            "button[type='submit']",
-            "input[type='submit']",
-            "role=button[name=/submit/i]",
-        ]
-        for selector in selectors:
-            locator = self._page.locator(selector)
+    async def _click_first(self, page, tiers) -> bool:
+        """Click the first element of the highest-priority tier that accepts a click."""
+        for tier in tiers:
+            locator = self._locate(page, *tier)
             if await locator.count():
                 try:
-                    await locator.first.click()
-                    await asyncio.sleep(1)
+                    await locator.click()
                     return True
                 except Exception:
                     continue
         return False
 
+    @staticmethod
+    def _locate(page, *selectors: str):
+        """Return the first element matching any of ``selectors``."""
+        locator = page.locator(selectors[0])
+        for selector in selectors[1:]:
+            locator = locator.or_(page.locator(selector))
+        return locator.first
+
     @staticmethod
     def _require_playwright():
         try:
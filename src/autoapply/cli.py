@@ -8,6 +8,8 @@ from pathlib import Path
 from .agent import AutoApplyAgent
 from .config import AgentConfig
 from .job_sources import RemotiveJobSource
+from .scoring_cache import ScoreCache
+from .utils.cache import default_cache_dir
 
 
 def parse_args() -> argparse.Namespace:
@@ -20,6 +22,11 @@ def parse_args() -> argparse.Namespace:
         default=["remotive"],
         help="Job sources to use (currently only 'remotive' is implemented)",
     )
+    parser.add_argument(
+        "--no-score-cache",
+        action="store_true",
+        help="Re-score every job instead of reusing scores from previous runs",
+    )
     return parser.parse_args()
 
 
@@ -37,9 +44,14 @@ def main() -> None:
     args = parse_args()
     config = AgentConfig.from_file(args.config)
     sources = create_sources(args.source)
-    agent = AutoApplyAgent(config=config, job_sources=sources)
+    score_cache = None if args.no_score_cache else ScoreCache(default_cache_dir() / "scores.sqlite")
+    agent = AutoApplyAgent(config=config, job_sources=sources, score_cache=score_cache)
 
-    results = asyncio.run(agent.apply(limit=args.limit))
+    try:
+        results = asyncio.run(agent.apply(limit=args.limit))
+    finally:
+        if score_cache is not None:
+            score_cache.close()
     if not results:
         print("No applications were submitted.")
         return
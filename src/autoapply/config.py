@@ -1,11 +1,16 @@
 """Configuration models for the auto apply agent."""
-from __future__ import annotations
 
 from pathlib import Path
 from typing import List, Optional, Sequence
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
+try:  # pragma: no cover - optional dependency
+    import yaml
+except ImportError:  # pragma: no cover - exercised when PyYAML is absent
+    yaml = None
+
 
 class ResumeConfig(BaseModel):
     """Configuration for the candidate resume."""
@@ -38,6 +43,9 @@ class JobSearchPreferences(BaseModel):
         description="List of rolling time windows (in days) to prioritise more recent jobs.",
     )
     limit_per_bucket: int = 25
+    max_concurrent_requests: int = Field(
+        8, ge=1, description="Maximum number of job source searches in flight at once."
+    )
     exclude_companies: Sequence[str] = Field(default_factory=list)
 
     @field_validator("freshness_buckets")
@@ -57,6 +65,7 @@ class AutomationSettings(BaseModel):
     wait_after_navigation: float = Field(2.0, ge=0.0)
     max_attempts_per_job: int = Field(3, ge=1)
     cooldown_between_jobs: float = Field(1.0, ge=0.0)
+    concurrency: int = Field(4, ge=1, description="Number of applications run in parallel.")
 
 
 class UserProfile(BaseModel):
@@ -84,17 +93,10 @@ class AgentConfig(BaseModel):
         path = path.expanduser()
         if not path.exists():
             raise FileNotFoundError(path)
-        content = path.read_text(encoding="utf-8")
         if path.suffix.lower() in {".yaml", ".yml"}:
-            try:
-                import yaml  # type: ignore
-            except ImportError as exc:  # pragma: no cover - optional dependency
-                raise RuntimeError(
-                    "YAML support requires the optional 'pyyaml' dependency"
-                ) from exc
-            data = yaml.safe_load(content)
+            if yaml is None:  # pragma: no cover - optional dependency
+                raise RuntimeError("YAML support requires the optional 'pyyaml' dependency")
+            data = yaml.safe_load(path.read_text(encoding="utf-8"))
         else:
-            import json
-
-            data = json.loads(content)
-        return cls.parse_obj(data)
+            data = orjson.loads(path.read_bytes())
+        return cls.model_validate(data)
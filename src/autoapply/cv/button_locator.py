@@ -1,16 +1,28 @@
 """Locate buttons within screenshots using simple template matching."""
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from typing import Iterable, Optional, Sequence, Tuple
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from PIL import Image, ImageDraw, ImageFont
 
+try:  # pragma: no cover - optional dependency
+    import cv2
+except ImportError:  # pragma: no cover - exercised when OpenCV is absent
+    cv2 = None
+
 
 @dataclass
 class MatchResult:
-    """Result of a button match."""
+    """Result of a button match.
+
+    ``score`` is the normalised correlation coefficient in ``[-1, 1]``; higher is
+    a better match.
+    """
 
     position: Tuple[int, int]
     score: float
@@ -19,64 +31,74 @@ class MatchResult:
 class ButtonLocator:
     """Identify application buttons on a web page screenshot."""
 
-    def __init__(self, templates: Optional[Sequence[Image.Image]] = None) -> None:
-        self.templates = list(templates) if templates else [self._default_template()]
-        self._template_arrays = [self._prepare_template(template) for template in self.templates]
+    def __init__(
+        self, templates: Optional[Sequence[Image.Image]] = None, scale: int = 4
+    ) -> None:
+        if scale < 1:
+            raise ValueError("scale must be a positive integer")
+        self.scale = scale
+        self._templates = list(templates) if templates else None
+        if self._templates is None:
+            default = Image.fromarray(_build_default_template())
+            self._template_arrays = [self._template_to_array(default)]
+        else:
+            self._template_arrays = [
+                self._template_to_array(template) for template in self._templates
+            ]
+
+    @property
+    def templates(self) -> List[Image.Image]:
+        """Template images; the default button is only rendered when requested."""
+        if self._templates is None:
+            self._templates = [_render_default_template()]
+        return self._templates
+
+    def _to_array(self, image: Image.Image) -> np.ndarray:
+        """Convert an image to a grayscale array downscaled by ``self.scale``."""
+        gray = image.convert("L")
+        if self.scale > 1:
+            size = (max(1, gray.width // self.scale), max(1, gray.height // self.scale))
+            gray = gray.resize(size, Image.BILINEAR)
+        return np.ascontiguousarray(gray, dtype=np.uint8)
+
+    def _template_to_array(self, template: Image.Image) -> np.ndarray:
+        """Downscale a template by exactly ``self.scale``, as screenshots are.
 
-    def _prepare_template(self, template: Image.Image) -> np.ndarray:
-        template_gray = template.convert("L")
-        return np.asarray(template_gray, dtype=np.float32) / 255.0
+        Flooring each side separately would stretch templates whose size is not a
+        multiple of the scale (a 50px-high button would shrink 4.17x against the
+        screenshot's 4x), so the template is centre-cropped to a multiple first.
+        """
+        scale = self.scale
+        if scale > 1:
+            width = max(scale, template.width // scale * scale)
+            height = max(scale, template.height // scale * scale)
+            left = (template.width - width) // 2
+            top = (template.height - height) // 2
+            template = template.crop((left, top, left + width, top + height))
+        return self._to_array(template)
 
     def find_best_match(self, screenshot: Image.Image) -> Optional[MatchResult]:
-        """Return the best matching template coordinate."""
-        image = screenshot.convert("L")
-        array = np.asarray(image, dtype=np.float32) / 255.0
+        """Return the best matching template coordinate in screenshot pixels."""
+        array = self._to_array(screenshot)
         matches = [self._match_template(array, template) for template in self._template_arrays]
         matches = [match for match in matches if match is not None]
         if not matches:
             return None
-        return min(matches, key=lambda result: result.score)
+        best = max(matches, key=lambda result: result.score)
+        x, y = best.position
+        return MatchResult(position=(x * self.scale, y * self.scale), score=best.score)
 
     def _match_template(self, image: np.ndarray, template: np.ndarray) -> Optional[MatchResult]:
         ih, iw = image.shape
         th, tw = template.shape
         if ih < th or iw < tw:
             return None
-        best_score = float("inf")
-        best_position: Optional[Tuple[int, int]] = None
-        for y in range(0, ih - th + 1, max(1, th // 4)):
-            for x in range(0, iw - tw + 1, max(1, tw // 4)):
-                patch = image[y : y + th, x : x + tw]
-                score = float(np.mean((patch - template) ** 2))
-                if score < best_score:
-                    best_score = score
-                    best_position = (x + tw // 2, y + th // 2)
-        if best_position is None:
-            return None
-        return MatchResult(position=best_position, score=best_score)
-
-    def _default_template(self) -> Image.Image:
-        width, height = 160, 50
-        template = Image.new("RGB", (width, height), color="#f97316")
-        draw = ImageDraw.Draw(template)
-        try:
-            font = ImageFont.truetype("arial.ttf", 28)
-        except OSError:  # pragma: no cover - depends on environment fonts
-            font = ImageFont.load_default()
-        text = "Apply Now"
-        try:
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-        except AttributeError:  # pragma: no cover - compatibility with older Pillow
-            text_width, text_height = draw.textsize(text, font=font)
-        draw.text(
-            ((width - text_width) / 2, (height - text_height) / 2),
-            text,
-            font=font,
-            fill="white",
-        )
-        return template
+        if cv2 is not None:
+            scores = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+        else:
+            scores = _correlation_map(image, template)
+        y, x = (int(v) for v in np.unravel_index(np.argmax(scores), scores.shape))
+        return MatchResult(position=(x + tw // 2, y + th // 2), score=float(scores[y, x]))
 
     def generate_augmented_templates(self) -> Iterable[Image.Image]:
         """Return a set of rotated/scaled template variants."""
@@ -84,3 +106,70 @@ class ButtonLocator:
             yield template
             yield template.resize((int(template.width * 0.9), int(template.height * 0.9)))
             yield template.resize((int(template.width * 1.1), int(template.height * 1.1)))
+
+
+def _render_default_template() -> Image.Image:
+    width, height = 160, 50
+    template = Image.new("RGB", (width, height), color="#f97316")
+    draw = ImageDraw.Draw(template)
+    try:
+        font = ImageFont.truetype("arial.ttf", 28)
+    except OSError:  # pragma: no cover - depends on environment fonts
+        font = ImageFont.load_default()
+    text = "Apply Now"
+    try:
+        bbox = draw.textbbox((0, 0), text, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+    except AttributeError:  # pragma: no cover - compatibility with older Pillow
+        text_width, text_height = draw.textsize(text, font=font)
+    draw.text(
+        ((width - text_width) / 2, (height - text_height) / 2),
+        text,
+        font=font,
+        fill="white",
+    )
+    return template
+
+
+@functools.lru_cache(maxsize=1)
+def _build_default_template() -> np.ndarray:
+    """Return the default template as a full-resolution grayscale array.
+
+    Font loading and rasterisation happen once per process rather than once per
+    locator; the array is read-only because every locator shares it.
+    """
+    array = np.asarray(_render_default_template().convert("L"), dtype=np.uint8)
+    array.flags.writeable = False
+    return array
+
+
+def _correlation_map(image: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """Compute the ``TM_CCOEFF_NORMED`` score map when OpenCV is unavailable.
+
+    Candidate windows are a view over the image, so no per-window copies are
+    made. Correlating with the zero-mean template equals correlating the
+    zero-mean window, and the window variance comes from integral images of
+    ``I`` and ``I^2``.
+    """
+    th, tw = template.shape
+    image64 = image.astype(np.float64)
+    centred = template.astype(np.float32) - float(template.mean())
+    windows = sliding_window_view(image.astype(np.float32), (th, tw))
+    cross = np.einsum("yxij,ij->yx", windows, centred)
+
+    window_sum = _window_sums(image64, th, tw)
+    window_sq_sum = _window_sums(image64 * image64, th, tw)
+    window_var = np.maximum(window_sq_sum - window_sum**2 / (th * tw), 0.0)
+    denominator = np.sqrt(window_var * float(np.sum(centred.astype(np.float64) ** 2)))
+    scores = np.zeros_like(denominator)
+    np.divide(cross, denominator, out=scores, where=denominator > 1e-6)
+    return scores
+
+
+def _window_sums(values: np.ndarray, th: int, tw: int) -> np.ndarray:
+    """Sum of every ``th`` x ``tw`` window, read from an integral image."""
+    ih, iw = values.shape
+    integral = np.zeros((ih + 1, iw + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(values, axis=0), axis=1, out=integral[1:, 1:])
+    return integral[th:, tw:] - integral[:-th, tw:] - integral[th:, :-tw] + integral[:-th, :-tw]
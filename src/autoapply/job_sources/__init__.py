@@ -1,6 +1,6 @@
 """Job source implementations."""
 
-from .base import JobPosting, JobQuery, JobSource
+from .base import JobPosting, JobQuery, JobSource, search_async
 from .remotive import RemotiveJobSource
 
-__all__ = ["JobPosting", "JobQuery", "JobSource", "RemotiveJobSource"]
+__all__ = ["JobPosting", "JobQuery", "JobSource", "RemotiveJobSource", "search_async"]
@@ -1,14 +1,21 @@
 """Base interfaces for job sources."""
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Optional, Protocol, Sequence
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Optional, Protocol, Sequence, Tuple
 
+_EMPTY_METADATA: Mapping[str, object] = MappingProxyType({})
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class JobQuery:
-    """Search query parameters passed to job sources."""
+    """Search query parameters passed to job sources.
+
+    Queries are shared between concurrent searches, so they are immutable.
+    """
 
     keywords: Sequence[str]
     location: Optional[str] = None
@@ -20,9 +27,13 @@ class JobQuery:
         return " ".join(self.keywords)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class JobPosting:
-    """Representation of a job returned by a source."""
+    """Representation of a job returned by a source.
+
+    Postings are immutable: ``tags`` is normalised to a tuple and ``metadata`` to
+    a read-only mapping, with empty values sharing a single instance.
+    """
 
     id: str
     title: str
@@ -34,8 +45,15 @@ class JobPosting:
     apply_url: Optional[str] = None
     description: Optional[str] = None
     salary: Optional[str] = None
-    tags: Sequence[str] = field(default_factory=list)
-    metadata: Dict[str, object] = field(default_factory=dict)
+    tags: Tuple[str, ...] = ()
+    metadata: Mapping[str, object] = field(default_factory=lambda: _EMPTY_METADATA, hash=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.tags, tuple):
+            object.__setattr__(self, "tags", tuple(self.tags))
+        if not isinstance(self.metadata, MappingProxyType):
+            metadata = MappingProxyType(dict(self.metadata)) if self.metadata else _EMPTY_METADATA
+            object.__setattr__(self, "metadata", metadata)
 
 
 class JobSource(Protocol):
@@ -47,6 +65,18 @@ class JobSource(Protocol):
         """Return a sequence of job postings matching the query."""
 
 
+async def search_async(source: JobSource, query: JobQuery, limit: int = 20) -> List[JobPosting]:
+    """Search a source without blocking the event loop.
+
+    Sources may provide their own ``search_async`` coroutine; otherwise the
+    blocking ``search`` call is run in a worker thread.
+    """
+    native = getattr(source, "search_async", None)
+    if native is not None:
+        return list(await native(query, limit=limit))
+    return list(await asyncio.to_thread(source.search, query, limit))
+
+
 def filter_jobs_by_age(
     jobs: Iterable[JobPosting], max_age_days: Optional[int]
 ) -> List[JobPosting]:
@@ -1,23 +1,60 @@
 """Job source implementation using the public Remotive API."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Iterable, List, Optional
+import asyncio
+import functools
+import itertools
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Optional
 
+import orjson
 import requests
-from dateutil import parser
 
+from ..utils.cache import default_cache_dir
+from ..utils.rate_limit import TokenBucket
 from .base import JobPosting, JobQuery, JobSource
 
+try:  # pragma: no cover - optional dependency
+    import ijson
+except ImportError:  # pragma: no cover - exercised when ijson is absent
+    ijson = None
+
+try:  # pragma: no cover - optional dependency
+    import requests_cache
+except ImportError:  # pragma: no cover - exercised when requests-cache is absent
+    requests_cache = None
+
 
 class RemotiveJobSource(JobSource):
     """Fetch job postings from the Remotive public API."""
 
     name = "remotive"
     api_url = "https://remotive.com/api/remote-jobs"
+    http_cache_ttl = 300
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        rate: float = 5.0,
+        burst: int = 10,
+    ) -> None:
+        self._session = session or self._default_session()
+        self._bucket = TokenBucket(rate, burst)
 
-    def __init__(self, session: Optional[requests.Session] = None) -> None:
-        self._session = session or requests.Session()
+    @classmethod
+    def _default_session(cls) -> requests.Session:
+        """Return a session that caches responses on disk when requests-cache is installed."""
+        if requests_cache is None:
+            return requests.Session()
+        return requests_cache.CachedSession(
+            str(default_cache_dir() / "remotive-http"),
+            backend="sqlite",
+            expire_after=cls.http_cache_ttl,
+        )
+
+    @staticmethod
+    def _is_caching(session) -> bool:
+        return requests_cache is not None and isinstance(session, requests_cache.CachedSession)
 
     def search(self, query: JobQuery, limit: int = 20) -> Iterable[JobPosting]:  # noqa: D401
         """Return matching job postings from Remotive."""
@@ -27,27 +64,49 @@ class RemotiveJobSource(JobSource):
         }
         if query.location:
             params["location"] = query.location
-        response = self._session.get(self.api_url, params=params, timeout=30)
-        response.raise_for_status()
-        payload = response.json()
-        jobs = payload.get("jobs", [])
-        return self._convert_jobs(jobs, query)
+        # With ijson the body is parsed incrementally and reading stops once
+        # ``limit`` postings have been kept. requests-cache reads the whole body
+        # to store it, so caching sessions decode the buffered body instead.
+        stream = ijson is not None and not self._is_caching(self._session)
+        response = self._session.get(self.api_url, params=params, timeout=30, stream=stream)
+        try:
+            response.raise_for_status()
+            if stream:
+                response.raw.decode_content = True
+                jobs = ijson.items(response.raw, "jobs.item", use_float=True)
+            else:
+                jobs = orjson.loads(response.content).get("jobs", [])
+            return self._convert_jobs(jobs, query, limit)
+        finally:
+            response.close()
+
+    async def search_async(self, query: JobQuery, limit: int = 20) -> Iterable[JobPosting]:
+        """Run :meth:`search` in a worker thread so searches can overlap.
+
+        Requests are metered through a token bucket so concurrent searches stay
+        under Remotive's rate limit instead of retrying on 429 responses.
+        """
+        await self._bucket.acquire()
+        return await asyncio.to_thread(self.search, query, limit)
 
     def _convert_jobs(
-        self, jobs_payload: List[dict], query: JobQuery
+        self, jobs_payload: Iterable[dict], query: JobQuery, limit: Optional[int] = None
     ) -> List[JobPosting]:
-        postings: List[JobPosting] = []
+        return list(itertools.islice(self._iter_postings(jobs_payload, query), limit))
+
+    def _iter_postings(self, jobs_payload: Iterable[dict], query: JobQuery) -> Iterator[JobPosting]:
+        # A job is kept while its age in whole days is at most posted_within_days.
+        cutoff = None
+        if query.posted_within_days:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=query.posted_within_days + 1)
         for job in jobs_payload:
-            published = parser.isoparse(job["publication_date"]).astimezone(timezone.utc)
-            if (
-                query.posted_within_days
-                and (datetime.now(timezone.utc) - published).days > query.posted_within_days
-            ):
+            published = _parse_timestamp(job["publication_date"])
+            if cutoff is not None and published <= cutoff:
                 continue
             location = job.get("candidate_required_location", "Remote")
             if query.remote_only and "remote" not in location.lower():
                 continue
-            posting = JobPosting(
+            yield JobPosting(
                 id=f"remotive-{job['id']}",
                 title=job.get("title", ""),
                 company=job.get("company_name", "Unknown"),
@@ -58,11 +117,24 @@ class RemotiveJobSource(JobSource):
                 apply_url=job.get("url"),
                 description=job.get("description"),
                 salary=job.get("salary"),
-                tags=job.get("tags", []),
+                tags=tuple(job.get("tags") or ()),
                 metadata={
                     "job_type": job.get("job_type"),
                     "category": job.get("category"),
                 },
             )
-            postings.append(posting)
-        return postings
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a Remotive ISO-8601 timestamp as an aware UTC datetime.
+
+    Remotive publishes naive UTC timestamps, and many postings share a date, so
+    results are cached.
+    """
+    if value.endswith("Z"):  # fromisoformat only accepts "Z" from Python 3.11
+        value = value[:-1] + "+00:00"
+    published = datetime.fromisoformat(value)
+    if published.tzinfo is None:
+        return published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc)
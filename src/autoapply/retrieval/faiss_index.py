@@ -0,0 +1,131 @@
+"""Dense retrieval over job postings used to prefilter large corpora."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ..job_sources import JobPosting
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+
+class SemanticIndex:
+    """Nearest-neighbour search of job postings by embedding similarity.
+
+    Postings are embedded with a sentence-transformers model. Each search runs
+    an exact FAISS inner-product index over only the postings it is given, so
+    results never include postings from earlier calls. When ``cache_dir`` is
+    given, embeddings are persisted there by posting id, so postings seen on
+    earlier runs are not re-encoded; the ``max_cached`` most recently used are
+    kept.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        model_name: str = DEFAULT_MODEL,
+        batch_size: int = 64,
+        max_cached: int = 50_000,
+    ) -> None:
+        self._faiss = self._require_faiss()
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_cached = max_cached
+        self.cache_dir = cache_dir / model_name.replace("/", "--") if cache_dir else None
+        self._model = None
+        # Posting id -> embedding, least recently used first.
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._dirty = False
+        if self.cache_dir is not None:
+            self._load()
+
+    def search(
+        self, resume_text: str, postings: Iterable[JobPosting], k: int = 100
+    ) -> List[JobPosting]:
+        """Return up to ``k`` of ``postings``, most similar to the resume first."""
+        unique = list({posting.id: posting for posting in postings}.values())
+        if not unique:
+            return []
+        vectors = self._embed(unique)
+        index = self._faiss.IndexFlatIP(vectors.shape[1])
+        index.add(vectors)
+        _, labels = index.search(self._encode([resume_text]), min(k, len(unique)))
+        return [unique[label] for label in labels[0] if label >= 0]
+
+    def save(self) -> None:
+        """Persist the most recently used embeddings and their posting ids to ``cache_dir``.
+
+        Nothing is written unless new postings were encoded since the last save.
+        """
+        if self.cache_dir is None or not self._dirty:
+            return
+        ids = list(self._vectors)[-self.max_cached :]
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        np.save(self.cache_dir / "embeddings.npy", np.stack([self._vectors[i] for i in ids]))
+        (self.cache_dir / "postings.json").write_text(json.dumps(ids), encoding="utf-8")
+        self._dirty = False
+
+    def _embed(self, postings: List[JobPosting]) -> np.ndarray:
+        """Embeddings for ``postings`` in order, encoding only those not cached."""
+        missing = [posting for posting in postings if posting.id not in self._vectors]
+        if missing:
+            encoded = self._encode([_posting_text(posting) for posting in missing])
+            for posting, vector in zip(missing, encoded):
+                self._vectors[posting.id] = vector
+            self._dirty = True
+        # Move used entries to the end so save() evicts the least recently used.
+        rows = [self._vectors.pop(posting.id) for posting in postings]
+        for posting, row in zip(postings, rows):
+            self._vectors[posting.id] = row
+        return np.ascontiguousarray(np.stack(rows), dtype=np.float32)
+
+    def _load(self) -> None:
+        assert self.cache_dir is not None
+        vectors_path = self.cache_dir / "embeddings.npy"
+        ids_path = self.cache_dir / "postings.json"
+        if not (vectors_path.exists() and ids_path.exists()):
+            return
+        try:
+            vectors = np.load(vectors_path)
+            ids = json.loads(ids_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return  # A corrupt cache only costs re-encoding.
+        if len(ids) != len(vectors):
+            return
+        self._vectors = dict(zip(ids, vectors))
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        if self._model is None:
+            self._model = self._require_sentence_transformers()(self.model_name)
+        embeddings = self._model.encode(
+            texts, batch_size=self.batch_size, normalize_embeddings=True
+        )
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    @staticmethod
+    def _require_faiss():
+        try:
+            import faiss
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "Semantic prefiltering requires FAISS. Install with 'pip install autoapply[semantic]'"
+            ) from exc
+        return faiss
+
+    @staticmethod
+    def _require_sentence_transformers():
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "Semantic prefiltering requires sentence-transformers. "
+                "Install with 'pip install autoapply[semantic]'"
+            ) from exc
+        return SentenceTransformer
+
+
+def _posting_text(posting: JobPosting) -> str:
+    return " ".join([posting.title, posting.description or "", " ".join(posting.tags)])
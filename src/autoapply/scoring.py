@@ -1,28 +1,51 @@
 """Score job matches against a resume profile."""
 from __future__ import annotations
 
+import functools
+import importlib.util
+import re
 from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import Iterable, List, Sequence
+
+import numpy as np
 
 from .job_sources import JobPosting
 
-_STOP_WORDS = {
-    "the",
-    "and",
-    "for",
-    "with",
-    "from",
-    "that",
-    "this",
-    "have",
-    "your",
-    "will",
-    "into",
-    "such",
-    "into",
-    "into",
-}
+
+@functools.lru_cache(maxsize=1)
+def _sklearn_available() -> bool:
+    """Whether scikit-learn is installed, checked without importing it.
+
+    scikit-learn is only imported by :meth:`ResumeScorer.score_batch`; importing
+    it eagerly would add most of a second to every ``import autoapply``.
+    """
+    return importlib.util.find_spec("sklearn") is not None
+
+
+#: Bump whenever tokenisation or scoring changes so persisted scores are recomputed.
+SCORER_VERSION = 2
+
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "with",
+        "from",
+        "that",
+        "this",
+        "have",
+        "your",
+        "will",
+        "into",
+        "such",
+    }
+)
+
+# Words of two or more characters; inner dots and hyphens are kept so terms like
+# "node.js" survive, while trailing punctuation is dropped.
+_TOKEN_RE = re.compile(r"[a-z](?:[a-z0-9+#]|[.\-](?=[a-z0-9+#]))+")
 
 
 @dataclass
@@ -38,24 +61,43 @@ class ResumeScorer:
 
     def __init__(self, resume_text: str, skills: Sequence[str] | None = None) -> None:
         tokens = self._tokenise(resume_text)
+        self._resume_tokens = list(tokens)
         self.resume_counts = Counter(tokens)
         self.skills = {skill.lower() for skill in skills or []}
+        self._skill_list = sorted(self.skills)
+        self._vocab = {token: index for index, token in enumerate(self.resume_counts)}
+        self._resume_vec = np.fromiter(
+            self.resume_counts.values(), dtype=np.int64, count=len(self._vocab)
+        )
+        self._resume_total = int(self._resume_vec.sum()) or 1
 
-    def _tokenise(self, text: str) -> Iterable[str]:
-        words = [word.strip().lower() for word in text.split()]
-        return [word for word in words if word and word not in _STOP_WORDS]
+    @property
+    def metric(self) -> str:
+        """Identify the keyword metric :meth:`score_batch` produces, for cache keys."""
+        kind = "cosine" if _sklearn_available() else "overlap"
+        return f"{kind}-v{SCORER_VERSION}"
 
-    def score(self, job: JobPosting) -> JobScore:
+    def _tokenise(self, text: str) -> List[str]:
+        return [word for word in _TOKEN_RE.findall(text.lower()) if word not in _STOP_WORDS]
+
+    def _job_tokens(self, job: JobPosting) -> List[str]:
         text_parts = [job.title, job.description or "", " ".join(job.tags)]
-        tokens = list(self._tokenise(" ".join(text_parts)))
-        job_counts = Counter(tokens)
-        intersection = sum(min(job_counts[token], self.resume_counts[token]) for token in job_counts)
-        resume_total = sum(self.resume_counts.values()) or 1
-        keyword_overlap = intersection / resume_total
-        skills_overlap = 0.0
-        if self.skills:
-            job_tokens = set(tokens)
-            skills_overlap = len(job_tokens & self.skills) / max(len(self.skills), 1)
+        return list(self._tokenise(" ".join(text_parts)))
+
+    def _skills_overlap(self, tokens: Iterable[str]) -> float:
+        if not self.skills:
+            return 0.0
+        return len(set(tokens) & self.skills) / max(len(self.skills), 1)
+
+    def _skills_overlap_batch(self, vectorizer, job_matrix) -> np.ndarray:
+        """Skills overlap for every row of ``job_matrix``, read from its skill columns."""
+        if not self.skills:
+            return np.zeros(job_matrix.shape[0])
+        columns = vectorizer.transform([[skill] for skill in self._skill_list]).indices
+        hits = job_matrix[:, columns] > 0
+        return np.asarray(hits.sum(axis=1)).ravel() / len(self._skill_list)
+
+    def _make_score(self, job: JobPosting, keyword_overlap: float, skills_overlap: float) -> JobScore:
         composite = (keyword_overlap * 0.7) + (skills_overlap * 0.3)
         return JobScore(
             job=job,
@@ -63,3 +105,37 @@ class ResumeScorer:
             keyword_overlap=keyword_overlap,
             composite=composite,
         )
+
+    def score(self, job: JobPosting) -> JobScore:
+        tokens = self._job_tokens(job)
+        vocab = self._vocab
+        ids = np.fromiter((vocab[token] for token in tokens if token in vocab), dtype=np.int64)
+        job_vec = np.bincount(ids, minlength=len(vocab))
+        intersection = int(np.minimum(job_vec, self._resume_vec).sum())
+        keyword_overlap = intersection / self._resume_total
+        return self._make_score(job, keyword_overlap, self._skills_overlap(tokens))
+
+    def score_batch(self, jobs: Sequence[JobPosting]) -> List[JobScore]:
+        """Score many jobs at once, in input order.
+
+        With scikit-learn installed the keyword term is the cosine similarity
+        between hashed term-frequency vectors of the resume and each job,
+        computed with one sparse matrix product over the whole batch. Hashing is
+        stateless, so a job scores the same whichever batch it is scored in.
+        Otherwise each job is scored with :meth:`score`.
+        """
+        jobs = list(jobs)
+        if not _sklearn_available() or not jobs or not self._resume_tokens:
+            return [self.score(job) for job in jobs]
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        job_tokens = [self._job_tokens(job) for job in jobs]
+        vectorizer = HashingVectorizer(analyzer=lambda tokens: tokens, alternate_sign=False)
+        matrix = vectorizer.transform([self._resume_tokens, *job_tokens])
+        # Rows are L2-normalised, so the dot product is the cosine similarity.
+        similarities = (matrix[1:] @ matrix[0].T).toarray().ravel()
+        skills = self._skills_overlap_batch(vectorizer, matrix[1:])
+        return [
+            self._make_score(job, float(similarity), float(overlap))
+            for job, similarity, overlap in zip(jobs, similarities, skills)
+        ]
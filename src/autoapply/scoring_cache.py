@@ -0,0 +1,62 @@
+"""Persistent cache of job scores keyed by resume content."""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Sequence, Tuple
+
+from .scoring import JobScore
+
+# Stay well below SQLite's default limit on bound parameters per statement.
+_MAX_PARAMS = 500
+
+
+class ScoreCache:
+    """Store ``(composite, keyword, skills)`` scores per ``(resume_hash, job_id)``."""
+
+    def __init__(self, path: Path) -> None:
+        path = path.expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS scores("
+            "resume_hash TEXT, job_id TEXT, composite REAL, keyword REAL, skills REAL, "
+            "PRIMARY KEY(resume_hash, job_id))"
+        )
+
+    def get_many(
+        self, resume_hash: str, job_ids: Sequence[str]
+    ) -> Dict[str, Tuple[float, float, float]]:
+        """Return cached ``(composite, keyword, skills)`` scores for the given jobs."""
+        found: Dict[str, Tuple[float, float, float]] = {}
+        for start in range(0, len(job_ids), _MAX_PARAMS):
+            chunk = list(job_ids[start : start + _MAX_PARAMS])
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.db.execute(
+                "SELECT job_id, composite, keyword, skills FROM scores "
+                f"WHERE resume_hash = ? AND job_id IN ({placeholders})",
+                [resume_hash, *chunk],
+            )
+            for job_id, composite, keyword, skills in rows:
+                found[job_id] = (composite, keyword, skills)
+        return found
+
+    def put_many(self, resume_hash: str, scores: Iterable[JobScore]) -> None:
+        """Insert or replace the given scores."""
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        resume_hash,
+                        score.job.id,
+                        score.composite,
+                        score.keyword_overlap,
+                        score.skills_overlap,
+                    )
+                    for score in scores
+                ],
+            )
+
+    def close(self) -> None:
+        self.db.close()
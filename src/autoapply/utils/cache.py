@@ -0,0 +1,9 @@
+"""Shared locations for on-disk caches."""
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def default_cache_dir() -> Path:
+    """Return the directory used for the agent's persistent caches."""
+    return Path.home() / ".cache" / "autoapply"
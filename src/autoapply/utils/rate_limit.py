@@ -0,0 +1,33 @@
+"""Client-side rate limiting for outbound API requests."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Meter coroutines to ``rate`` calls per second with bursts of up to ``burst``.
+
+    Each caller reserves the next token synchronously and then sleeps until it
+    is due, so concurrent callers queue up fairly without needing a lock as long
+    as the bucket is used from a single event loop.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
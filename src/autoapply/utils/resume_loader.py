@@ -1,24 +1,73 @@
 """Utilities for loading and caching resume information."""
 from __future__ import annotations
 
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from pypdf import PdfReader
 
+from .cache import default_cache_dir
+
+# Below this page count, process pool start-up costs more than it saves.
+PARALLEL_PAGE_THRESHOLD = 4
+
 
 def extract_text_from_pdf(path: Path) -> str:
-    """Extract text from a PDF resume."""
+    """Extract text from a PDF resume.
+
+    Long documents are extracted page by page across worker processes, since
+    pypdf's text extraction is CPU-bound pure Python.
+    """
     reader = PdfReader(str(path))
-    pages = [page.extract_text() or "" for page in reader.pages]
+    page_count = len(reader.pages)
+    if page_count < PARALLEL_PAGE_THRESHOLD:
+        pages = [page.extract_text() or "" for page in reader.pages]
+    else:
+        workers = min(page_count, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pages = list(
+                executor.map(_extract_page, [(str(path), index) for index in range(page_count)])
+            )
     return "\n".join(pages)
 
 
+def _extract_page(job: Tuple[str, int]) -> str:
+    path, index = job
+    return PdfReader(path).pages[index].extract_text() or ""
+
+
 def load_resume_text(resume_path: Path, cache_path: Optional[Path] = None) -> str:
-    """Load resume text using a cache if provided."""
-    if cache_path and cache_path.exists():
-        return cache_path.read_text(encoding="utf-8")
+    """Load resume text, reusing a previous extraction of the same PDF content.
+
+    Cached text is keyed by the SHA-256 of the PDF bytes. Without ``cache_path``
+    it lives at ``~/.cache/autoapply/resume-<digest>.txt``; an explicit cache
+    file gets a ``.sha256`` sidecar and is only reused while the digest matches,
+    so replacing the resume invalidates it.
+    """
+    digest = hashlib.sha256(resume_path.read_bytes()).hexdigest()
+    if cache_path is None:
+        target = default_cache_dir() / f"resume-{digest}.txt"
+        stamp = None
+    else:
+        target = cache_path
+        stamp = cache_path.with_name(cache_path.name + ".sha256")
+
+    if target.exists() and (stamp is None or _read_stamp(stamp) == digest):
+        return target.read_text(encoding="utf-8")
+
     text = extract_text_from_pdf(resume_path)
-    if cache_path:
-        cache_path.write_text(text, encoding="utf-8")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(text, encoding="utf-8")
+    if stamp is not None:
+        stamp.write_text(digest, encoding="utf-8")
     return text
+
+
+def _read_stamp(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from autoapply.cv.button_locator import ButtonLocator
+from autoapply.job_sources.base import JobPosting
+
+# ResumeScorer imports scikit-learn lazily; import it before pyfakefs hides the
+# real filesystem from tests using ``blank_resume_pdf``.
+try:  # pragma: no cover - optional dependency
+    import sklearn.feature_extraction.text  # noqa: F401
+except ImportError:  # pragma: no cover - exercised when scikit-learn is absent
+    pass
+
+# A one-page 72x72pt blank PDF, generated once with pypdf's PdfWriter.
+MINIMAL_PDF = (
+    b"%PDF-1.3\n%\xe2\xe3\xcf\xd3\n"
+    b"1 0 obj\n<<\n/Producer (pypdf)\n>>\nendobj\n"
+    b"2 0 obj\n<<\n/Type /Pages\n/Count 1\n/Kids [ 4 0 R ]\n>>\nendobj\n"
+    b"3 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n"
+    b"4 0 obj\n<<\n/Type /Page\n/Resources <<\n>>\n/MediaBox [ 0.0 0.0 72 72 ]\n"
+    b"/Parent 2 0 R\n>>\nendobj\n"
+    b"xref\n0 5\n0000000000 65535 f \n0000000015 00000 n \n0000000054 00000 n \n"
+    b"0000000113 00000 n \n0000000162 00000 n \n"
+    b"trailer\n<<\n/Size 5\n/Root 3 0 R\n/Info 1 0 R\n>>\nstartxref\n254\n%%EOF\n"
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_home(tmp_path_factory):
+    """Point ``Path.home()`` at a temp directory so tests never touch the user's cache."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("HOME", str(tmp_path_factory.mktemp("home")))
+        yield
+
+
+@pytest.fixture
+def blank_resume_pdf(fs):
+    """Blank resume PDF on pyfakefs's in-memory filesystem."""
+    path = Path("/resume.pdf")
+    fs.create_file(path, contents=MINIMAL_PDF)
+    return path
+
+
+@pytest.fixture(scope="session")
+def make_job():
+    """Return a factory for ``JobPosting`` objects; unspecified fields get placeholders."""
+
+    def make(job_id: str = "job", **fields) -> JobPosting:
+        defaults = {
+            "title": "Engineer",
+            "company": "Example",
+            "location": "Remote",
+            "url": f"https://example.com/{job_id}",
+            "source": "test",
+            "published_at": datetime.now(timezone.utc),
+        }
+        return JobPosting(id=job_id, **{**defaults, **fields})
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def locator():
+    return ButtonLocator()
+
+
+@pytest.fixture(scope="module")
+def offset(locator):
+    """Paste position of the template, rounded up to a multiple of ``locator.scale``."""
+    template = locator.templates[0]
+    return tuple(-(-size // locator.scale) * locator.scale for size in template.size)
+
+
+@pytest.fixture(scope="module")
+def screenshot(locator, offset):
+    """The default template pasted on a white canvas three templates wide.
+
+    The template sits on a scale-aligned offset; off-grid pastes blur its edges
+    when downscaled and roughly halve the correlation score.
+    """
+    template = locator.templates[0]
+    image = Image.new("RGB", (offset[0] * 3, offset[1] * 3), "white")
+    image.paste(template, offset)
+    return image
+
+
+@pytest.fixture(scope="session")
+def stub_session():
+    """Return a factory for sessions that answer every GET with ``payload`` as JSON."""
+
+    def make(payload):
+        body = json.dumps(payload).encode("utf-8")
+
+        def get(*args, **kwargs):
+            return SimpleNamespace(
+                content=body,
+                raw=io.BytesIO(body),
+                status_code=200,
+                raise_for_status=lambda: None,
+                close=lambda: None,
+            )
+
+        return SimpleNamespace(get=get)
+
+    return make
+
+
+class _AsyncioWithoutSleep:
+    """Stand-in for the ``asyncio`` module whose ``sleep`` returns immediately."""
+
+    async def sleep(self, *args, **kwargs):
+        return None
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+
+@pytest.fixture(autouse=True)
+def _fast_sleep(monkeypatch):
+    """With ``FAST_TESTS=1``, skip the agent's retry and cooldown sleeps.
+
+    Only the agent module's ``asyncio`` reference is replaced, so the shared
+    ``asyncio.sleep`` used by the rate limiter and browser automation is untouched.
+    """
+    if os.environ.get("FAST_TESTS") == "1":
+        monkeypatch.setattr("autoapply.agent.asyncio", _AsyncioWithoutSleep())
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_find_best_match(benchmark, locator, screenshot, offset):
+    match = benchmark(locator.find_best_match, screenshot)
+
+    assert match is not None
+    assert match.score > 0.5
+    assert abs(match.position[0] - offset[0]) < locator.templates[0].width
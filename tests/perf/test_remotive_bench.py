@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from autoapply.job_sources import JobQuery
+from autoapply.job_sources.remotive import RemotiveJobSource
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+JOB_COUNT = 1000
+#: Postings are spread over the last ten days; a seven-day query keeps ages 0-7 days.
+KEPT = sum(1 for index in range(JOB_COUNT) if index % 240 < 8 * 24)
+
+
+@pytest.fixture(scope="module")
+def payload():
+    now = datetime.now(timezone.utc)
+    return {
+        "jobs": [
+            {
+                "id": index,
+                "title": f"Python Developer {index}",
+                "company_name": f"Company {index % 50}",
+                "candidate_required_location": "Remote",
+                "publication_date": (now - timedelta(hours=index % 240)).isoformat(),
+                "url": f"https://remotive.com/jobs/{index}",
+                "description": "Build automation tooling in Python. " * 20,
+                "tags": ["Python", "Automation"],
+                "job_type": "full_time",
+                "category": "Software Development",
+            }
+            for index in range(JOB_COUNT)
+        ]
+    }
+
+
+def test_search(benchmark, payload, stub_session):
+    source = RemotiveJobSource(session=stub_session(payload))
+    query = JobQuery(keywords=["python"], posted_within_days=7)
+
+    results = benchmark(source.search, query, JOB_COUNT)
+
+    assert len(results) == KEPT
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
-from pypdf import PdfWriter
 
 from autoapply.agent import AutoApplyAgent
 from autoapply.config import (
@@ -16,6 +16,9 @@ from autoapply.config import (
 )
 from autoapply.job_sources.base import JobPosting, JobQuery
 
+# Captured once per module; the agent filters by age against the real clock.
+NOW = datetime.now(timezone.utc)
+
 
 class FakeJobSource:
     name = "fake"
@@ -29,7 +32,7 @@ class FakeJobSource:
 
 class FakeAutomationContext:
     def __init__(self):
-        self.calls: list[str] = []
+        self.calls: deque[str] = deque()
 
     async def __aenter__(self):
         return self
@@ -42,21 +45,42 @@ class FakeAutomationContext:
         return True, "submitted"
 
 
-@pytest.mark.asyncio
-async def test_agent_ranks_jobs_and_respects_limit(tmp_path):
-    resume_path = tmp_path / "resume.pdf"
-    writer = PdfWriter()
-    writer.add_blank_page(width=72, height=72)
-    with resume_path.open("wb") as fh:
-        writer.write(fh)
+@pytest.fixture
+def sample_jobs():
+    return [
+        JobPosting(
+            id="job-1",
+            title="Python Automation Engineer",
+            company="Automation Inc",
+            location="Remote",
+            url="https://example.com/job-1",
+            source="fake",
+            published_at=NOW - timedelta(hours=1),
+            description="We need an automation expert with Python skills",
+            tags=["Python", "Automation"],
+        ),
+        JobPosting(
+            id="job-2",
+            title="Data Analyst",
+            company="DataWorks",
+            location="Remote",
+            url="https://example.com/job-2",
+            source="fake",
+            published_at=NOW - timedelta(hours=2),
+            description="Analyse data",
+            tags=["SQL"],
+        ),
+    ]
+
 
+async def test_agent_ranks_jobs_and_respects_limit(blank_resume_pdf, sample_jobs):
     config = AgentConfig(
         user=UserProfile(
             full_name="Alex Candidate",
             email="alex@example.com",
             skills=["python", "automation"],
         ),
-        resume=ResumeConfig(path=resume_path),
+        resume=ResumeConfig(path=blank_resume_pdf),
         search=JobSearchPreferences(
             keywords=["python", "automation"],
             locations=[],
@@ -73,32 +97,6 @@ async def test_agent_ranks_jobs_and_respects_limit(tmp_path):
         ),
     )
 
-    now = datetime.now(timezone.utc)
-    jobs = [
-        JobPosting(
-            id="job-1",
-            title="Python Automation Engineer",
-            company="Automation Inc",
-            location="Remote",
-            url="https://example.com/job-1",
-            source="fake",
-            published_at=now - timedelta(hours=1),
-            description="We need an automation expert with Python skills",
-            tags=["Python", "Automation"],
-        ),
-        JobPosting(
-            id="job-2",
-            title="Data Analyst",
-            company="DataWorks",
-            location="Remote",
-            url="https://example.com/job-2",
-            source="fake",
-            published_at=now - timedelta(hours=2),
-            description="Analyse data",
-            tags=["SQL"],
-        ),
-    ]
-
     fake_context = FakeAutomationContext()
 
     def automation_factory(_config: AgentConfig):
@@ -106,7 +104,7 @@ async def test_agent_ranks_jobs_and_respects_limit(tmp_path):
 
     agent = AutoApplyAgent(
         config=config,
-        job_sources=[FakeJobSource(jobs)],
+        job_sources=[FakeJobSource(sample_jobs)],
         automation_factory=automation_factory,
         resume_text="Python automation specialist",
     )
@@ -115,4 +113,184 @@ async def test_agent_ranks_jobs_and_respects_limit(tmp_path):
 
     assert len(results) == 1
     assert results[0].job.id == "job-1"
-    assert fake_context.calls == ["job-1"]
+    assert list(fake_context.calls) == ["job-1"]
+
+
+class RecordingJobSource(FakeJobSource):
+    def __init__(self, jobs):
+        super().__init__(jobs)
+        self.queries: list[tuple[JobQuery, int]] = []
+
+    def search(self, query: JobQuery, limit: int = 20):
+        self.queries.append((query, limit))
+        return self._jobs
+
+
+def test_discover_jobs_queries_widest_window_once_and_orders_fresh_first(
+    blank_resume_pdf, make_job
+):
+    config = AgentConfig(
+        user=UserProfile(full_name="Alex Candidate", email="alex@example.com"),
+        resume=ResumeConfig(path=blank_resume_pdf),
+        search=JobSearchPreferences(
+            keywords=["python"],
+            locations=["Remote", "Europe"],
+            max_age_days=7,
+            freshness_buckets=[1, 3, 7],
+            limit_per_bucket=5,
+            exclude_companies=["Blocked Co"],
+        ),
+    )
+
+    def job(job_id: str, age: timedelta, company: str = "Example") -> JobPosting:
+        return make_job(job_id, company=company, source="fake", published_at=NOW - age)
+
+    source = RecordingJobSource(
+        [
+            job("old", timedelta(days=5)),
+            job("fresh", timedelta(hours=2)),
+            job("blocked", timedelta(hours=1), company="Blocked Co"),
+            job("stale", timedelta(days=10)),
+        ]
+    )
+    agent = AutoApplyAgent(config=config, job_sources=[source], resume_text="")
+
+    jobs = agent.discover_jobs()
+
+    assert [job.id for job in jobs] == ["fresh", "old"]
+    issued = {(query.location, query.posted_within_days, limit) for query, limit in source.queries}
+    assert len(source.queries) == 2
+    assert issued == {("Remote", 7, 15), ("Europe", 7, 15)}
+
+
+def test_rank_jobs_memoizes_scores_per_resume(blank_resume_pdf, sample_jobs):
+    config = AgentConfig(
+        user=UserProfile(full_name="Alex Candidate", email="alex@example.com", skills=["python"]),
+        resume=ResumeConfig(path=blank_resume_pdf),
+        search=JobSearchPreferences(keywords=["python"]),
+    )
+    agent = AutoApplyAgent(
+        config=config, job_sources=[], resume_text="Python automation specialist"
+    )
+    scored: list[str] = []
+    score_batch = agent.scorer.score_batch
+
+    def recording_score_batch(jobs):
+        scored.extend(job.id for job in jobs)
+        return score_batch(jobs)
+
+    agent.scorer.score_batch = recording_score_batch
+
+    first = agent.rank_jobs(sample_jobs)
+    second = agent.rank_jobs(sample_jobs)
+
+    assert sorted(scored) == ["job-1", "job-2"]
+    assert [score.job.id for score in second] == [score.job.id for score in first]
+    assert [score.composite for score in second] == [score.composite for score in first]
+
+
+def test_rank_jobs_scores_new_jobs_consistently_with_memoized_ones(blank_resume_pdf, sample_jobs):
+    config = AgentConfig(
+        user=UserProfile(full_name="Alex Candidate", email="alex@example.com", skills=["python"]),
+        resume=ResumeConfig(path=blank_resume_pdf),
+        search=JobSearchPreferences(keywords=["python"]),
+    )
+    resume_text = "Python automation specialist"
+    memoized = AutoApplyAgent(config=config, job_sources=[], resume_text=resume_text)
+    fresh = AutoApplyAgent(config=config, job_sources=[], resume_text=resume_text)
+
+    memoized.rank_jobs(sample_jobs[:1])
+    incremental = memoized.rank_jobs(sample_jobs)
+    expected = fresh.rank_jobs(sample_jobs)
+
+    assert [score.job.id for score in incremental] == [score.job.id for score in expected]
+    assert [score.composite for score in incremental] == pytest.approx(
+        [score.composite for score in expected]
+    )
+
+
+class FailingAutomationContext(FakeAutomationContext):
+    async def apply_to_job(self, job: JobPosting, user: UserProfile, resume_path: Path):
+        self.calls.append(job.id)
+        if job.id == "job-1":
+            raise TimeoutError("page.goto timed out")
+        return True, "submitted"
+
+
+async def test_apply_reports_a_failing_job_without_aborting_the_rest(
+    blank_resume_pdf, sample_jobs
+):
+    config = AgentConfig(
+        user=UserProfile(full_name="Alex Candidate", email="alex@example.com", skills=["python"]),
+        resume=ResumeConfig(path=blank_resume_pdf),
+        search=JobSearchPreferences(keywords=["python"], max_age_days=3, freshness_buckets=[3]),
+        automation=AutomationSettings(
+            max_attempts_per_job=1, cooldown_between_jobs=0.0, concurrency=2
+        ),
+    )
+    fake_context = FailingAutomationContext()
+    agent = AutoApplyAgent(
+        config=config,
+        job_sources=[FakeJobSource(sample_jobs)],
+        automation_factory=lambda _config: fake_context,
+        resume_text="Python automation specialist",
+    )
+
+    results = await agent.apply()
+
+    assert sorted(fake_context.calls) == ["job-1", "job-2"]
+    outcomes = {result.job.id: (result.success, result.message) for result in results}
+    assert outcomes == {"job-1": (False, "page.goto timed out"), "job-2": (True, "submitted")}
+
+
+def test_rank_jobs_scores_everything_when_semantic_prefilter_fails(
+    blank_resume_pdf, sample_jobs, monkeypatch
+):
+    class OfflineIndex:
+        def __init__(self, cache_dir=None):
+            pass
+
+        def search(self, resume_text, jobs, k):
+            raise OSError("model download failed")
+
+    monkeypatch.setattr("autoapply.agent.SemanticIndex", OfflineIndex)
+    config = AgentConfig(
+        user=UserProfile(full_name="Alex Candidate", email="alex@example.com"),
+        resume=ResumeConfig(path=blank_resume_pdf),
+        search=JobSearchPreferences(keywords=["python"]),
+    )
+    agent = AutoApplyAgent(config=config, job_sources=[], resume_text="Python automation")
+    agent.semantic_prefilter_threshold = 1
+
+    scores = agent.rank_jobs(sample_jobs)
+
+    assert sorted(score.job.id for score in scores) == ["job-1", "job-2"]
+
+
+class BrokenLaunchContext(FakeAutomationContext):
+    async def __aenter__(self):
+        raise RuntimeError("browser failed to launch")
+
+
+async def test_apply_releases_claimed_jobs_when_the_browser_fails_to_launch(
+    blank_resume_pdf, sample_jobs
+):
+    config = AgentConfig(
+        user=UserProfile(full_name="Alex Candidate", email="alex@example.com"),
+        resume=ResumeConfig(path=blank_resume_pdf),
+        search=JobSearchPreferences(keywords=["python"], max_age_days=3, freshness_buckets=[3]),
+        automation=AutomationSettings(cooldown_between_jobs=0.0),
+    )
+    contexts = [BrokenLaunchContext(), FakeAutomationContext()]
+    agent = AutoApplyAgent(
+        config=config,
+        job_sources=[FakeJobSource(sample_jobs)],
+        automation_factory=lambda _config: contexts.pop(0),
+        resume_text="Python automation specialist",
+    )
+
+    with pytest.raises(RuntimeError, match="failed to launch"):
+        await agent.apply(limit=1)
+    results = await agent.apply(limit=1)
+
+    assert [result.job.id for result in results] == ["job-1"]
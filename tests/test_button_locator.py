@@ -1,20 +1,49 @@
 from __future__ import annotations
 
+import pytest
 from PIL import Image
 
-from autoapply.cv.button_locator import ButtonLocator
+from autoapply.cv import button_locator
 
 
-def test_button_locator_finds_button():
-    locator = ButtonLocator()
-    screenshot = Image.new("RGB", (400, 300), "white")
-    template = locator.templates[0]
-    paste_position = (120, 140)
-    screenshot.paste(template, paste_position)
-
-    match = locator.find_best_match(screenshot)
+def _assert_centred_on_template(match, template, offset):
     assert match is not None
-    expected_x = paste_position[0] + template.width // 2
-    expected_y = paste_position[1] + template.height // 2
+    expected_x = offset[0] + template.width // 2
+    expected_y = offset[1] + template.height // 2
     assert abs(match.position[0] - expected_x) < template.width // 2
     assert abs(match.position[1] - expected_y) < template.height // 2
+    assert match.score > 0.5
+
+
+def test_button_locator_finds_button(locator, screenshot, offset):
+    match = locator.find_best_match(screenshot)
+
+    _assert_centred_on_template(match, locator.templates[0], offset)
+
+
+def test_button_locator_without_opencv(locator, screenshot, offset, monkeypatch):
+    monkeypatch.setattr(button_locator, "cv2", None)
+
+    match = locator.find_best_match(screenshot)
+
+    _assert_centred_on_template(match, locator.templates[0], offset)
+
+
+@pytest.mark.parametrize("use_opencv", [True, False], ids=["opencv", "numpy"])
+def test_button_locator_finds_button_off_the_downscale_grid(
+    locator, offset, use_opencv, monkeypatch
+):
+    if not use_opencv:
+        monkeypatch.setattr(button_locator, "cv2", None)
+    elif button_locator.cv2 is None:
+        pytest.skip("OpenCV not installed")
+    template = locator.templates[0]
+    unaligned = (offset[0] + 1, offset[1] + 3)
+    image = Image.new("RGB", (offset[0] * 3, offset[1] * 3), "white")
+    image.paste(template, unaligned)
+
+    match = locator.find_best_match(image)
+
+    assert match is not None
+    assert abs(match.position[0] - (unaligned[0] + template.width // 2)) <= locator.scale
+    assert abs(match.position[1] - (unaligned[1] + template.height // 2)) <= locator.scale
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+import warnings
+from pathlib import Path
+
+import pytest
+
+from autoapply.config import AgentConfig
+
+
+def _write_config(tmp_path, suffix: str, dump) -> Path:
+    resume_path = tmp_path / "resume.pdf"
+    resume_path.write_bytes(b"%PDF-1.4")
+    data = {
+        "user": {"full_name": "Alex Candidate", "email": "alex@example.com"},
+        "resume": {"path": str(resume_path)},
+        "search": {"keywords": ["python"], "freshness_buckets": [3, 1]},
+    }
+    path = tmp_path / f"config{suffix}"
+    path.write_text(dump(data), encoding="utf-8")
+    return path
+
+
+def test_from_file_loads_json_without_warnings(tmp_path):
+    path = _write_config(tmp_path, ".json", json.dumps)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        config = AgentConfig.from_file(path)
+
+    assert config.search.freshness_buckets == [1, 3]
+    assert config.automation.concurrency == 4
+
+
+def test_from_file_loads_yaml(tmp_path):
+    yaml = pytest.importorskip("yaml")
+    path = _write_config(tmp_path, ".yaml", yaml.safe_dump)
+
+    assert AgentConfig.from_file(path).user.email == "alex@example.com"
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from autoapply.utils import rate_limit
+from autoapply.utils.rate_limit import TokenBucket
+
+
+async def test_token_bucket_allows_burst_then_meters(monkeypatch):
+    clock = [100.0]
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        clock[0] += delay
+
+    # Swap the module's references rather than patching the shared ``time`` and
+    # ``asyncio`` modules, which the event loop itself relies on.
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(rate_limit, "asyncio", SimpleNamespace(sleep=fake_sleep))
+
+    bucket = TokenBucket(rate=2.0, burst=2)
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert sleeps == pytest.approx([0.5, 0.5])
+
+
+def test_token_bucket_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
@@ -1,48 +1,113 @@
 from __future__ import annotations
 
+import io
+import json
 from datetime import datetime, timedelta, timezone
 
-import responses
-
-from autoapply.job_sources import JobQuery
-from autoapply.job_sources.remotive import RemotiveJobSource
-
-
-@responses.activate
-def test_remotive_filters_by_age():
-    source = RemotiveJobSource()
-    now = datetime.now(timezone.utc)
-    old_date = (now - timedelta(days=5)).isoformat()
-    fresh_date = (now - timedelta(hours=12)).isoformat()
-    responses.add(
-        responses.GET,
-        "https://remotive.com/api/remote-jobs",
-        json={
-            "jobs": [
-                {
-                    "id": 1,
-                    "title": "Python Developer",
-                    "company_name": "Fresh Corp",
-                    "candidate_required_location": "Remote",
-                    "publication_date": fresh_date,
-                    "url": "https://remotive.com/jobs/1",
-                    "description": "Work with Python",
-                    "tags": ["Python"],
-                },
-                {
-                    "id": 2,
-                    "title": "Old Job",
-                    "company_name": "Legacy Corp",
-                    "candidate_required_location": "Remote",
-                    "publication_date": old_date,
-                    "url": "https://remotive.com/jobs/2",
-                    "description": "Old listing",
-                    "tags": [],
-                },
-            ]
-        },
-    )
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from urllib3.response import HTTPResponse
+
+from autoapply.job_sources import JobQuery, remotive
+from autoapply.job_sources.remotive import RemotiveJobSource, _parse_timestamp
+
+NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def payload():
+    return {
+        "jobs": [
+            {
+                "id": 1,
+                "title": "Python Developer",
+                "company_name": "Fresh Corp",
+                "candidate_required_location": "Remote",
+                "publication_date": (NOW - timedelta(hours=12)).isoformat(),
+                "url": "https://remotive.com/jobs/1",
+                "description": "Work with Python",
+                "tags": ["Python"],
+            },
+            {
+                "id": 2,
+                "title": "Old Job",
+                "company_name": "Legacy Corp",
+                "candidate_required_location": "Remote",
+                "publication_date": (NOW - timedelta(days=5)).isoformat(),
+                "url": "https://remotive.com/jobs/2",
+                "description": "Old listing",
+                "tags": [],
+            },
+        ]
+    }
+
+
+@pytest.mark.parametrize("streaming", [True, False], ids=["ijson", "buffered"])
+def test_remotive_filters_by_age(payload, stub_session, streaming, monkeypatch):
+    if not streaming:
+        monkeypatch.setattr(remotive, "ijson", None)
+    elif remotive.ijson is None:
+        pytest.skip("ijson not installed")
+    source = RemotiveJobSource(session=stub_session(payload))
     query = JobQuery(keywords=["python"], posted_within_days=2)
     results = list(source.search(query, limit=10))
     assert len(results) == 1
     assert results[0].company == "Fresh Corp"
+    assert results[0].tags == ("Python",)
+
+
+def test_remotive_stops_at_limit(payload, stub_session):
+    source = RemotiveJobSource(session=stub_session(payload))
+    query = JobQuery(keywords=["python"], posted_within_days=7)
+    results = list(source.search(query, limit=1))
+    assert [job.id for job in results] == ["remotive-1"]
+
+
+class _PayloadAdapter(BaseAdapter):
+    """Serve ``payload`` as a streamable HTTP response for every request."""
+
+    def __init__(self, payload):
+        super().__init__()
+        self.body = json.dumps(payload).encode("utf-8")
+        self.streams: list[bool] = []
+
+    def send(self, request, stream=False, **kwargs):
+        self.streams.append(stream)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response.raw = HTTPResponse(
+            body=io.BytesIO(self.body), preload_content=False, status=200
+        )
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def test_remotive_repeats_search_through_response_cache(payload):
+    requests_cache = pytest.importorskip("requests_cache")
+    adapter = _PayloadAdapter(payload)
+    session = requests_cache.CachedSession(backend="memory", expire_after=300)
+    session.mount("https://", adapter)
+    source = RemotiveJobSource(session=session)
+    query = JobQuery(keywords=["python"], posted_within_days=2)
+
+    first = source.search(query, limit=10)
+    second = source.search(query, limit=10)
+
+    # requests-cache buffers the whole body anyway, so the source does not stream.
+    assert adapter.streams == [False]
+    assert [job.id for job in second] == [job.id for job in first] == ["remotive-1"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2024-03-01T12:30:00", "2024-03-01T12:30:00Z", "2024-03-01T13:30:00+01:00"],
+)
+def test_parse_timestamp_returns_utc(value):
+    assert _parse_timestamp(value) == datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+    assert _parse_timestamp(value).tzinfo is timezone.utc
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+from pypdf import PdfWriter
+from pypdf.generic import ContentStream, DictionaryObject, NameObject
+
+from autoapply.utils import resume_loader
+from autoapply.utils.resume_loader import (
+    PARALLEL_PAGE_THRESHOLD,
+    extract_text_from_pdf,
+    load_resume_text,
+)
+
+
+def _fake_extractor(monkeypatch):
+    calls: list[bytes] = []
+
+    def extract(path):
+        data = path.read_bytes()
+        calls.append(data)
+        return data.decode("ascii")
+
+    monkeypatch.setattr(resume_loader, "extract_text_from_pdf", extract)
+    return calls
+
+
+def test_default_cache_is_keyed_by_pdf_content(tmp_path, monkeypatch):
+    calls = _fake_extractor(monkeypatch)
+    monkeypatch.setattr(resume_loader, "default_cache_dir", lambda: tmp_path / "cache")
+    resume = tmp_path / "resume.pdf"
+
+    resume.write_bytes(b"first")
+    assert load_resume_text(resume) == "first"
+    assert load_resume_text(resume) == "first"
+    resume.write_bytes(b"second")
+    assert load_resume_text(resume) == "second"
+
+    assert calls == [b"first", b"second"]
+
+
+def test_explicit_cache_is_invalidated_when_resume_changes(tmp_path, monkeypatch):
+    calls = _fake_extractor(monkeypatch)
+    resume = tmp_path / "resume.pdf"
+    cache = tmp_path / "resume.txt"
+
+    resume.write_bytes(b"first")
+    assert load_resume_text(resume, cache) == "first"
+    assert load_resume_text(resume, cache) == "first"
+    resume.write_bytes(b"second")
+    assert load_resume_text(resume, cache) == "second"
+
+    assert calls == [b"first", b"second"]
+    assert cache.read_text(encoding="utf-8") == "second"
+
+
+def _write_text_pdf(path, texts):
+    """Write a PDF with one Helvetica line of text per page."""
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    for text in texts:
+        page = writer.add_blank_page(200, 200)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        contents = ContentStream(None, None)
+        contents.set_data(f"BT /F1 12 Tf 20 100 Td ({text}) Tj ET".encode("ascii"))
+        page.replace_contents(contents)
+    with open(path, "wb") as handle:
+        writer.write(handle)
+
+
+def test_long_pdf_is_extracted_across_processes_in_page_order(tmp_path, monkeypatch):
+    pools: list[int] = []
+
+    def recording_pool(max_workers):
+        pools.append(max_workers)
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+    monkeypatch.setattr(resume_loader, "ProcessPoolExecutor", recording_pool)
+    texts = [f"Page {number}" for number in range(PARALLEL_PAGE_THRESHOLD)]
+    resume = tmp_path / "resume.pdf"
+    _write_text_pdf(resume, texts)
+
+    assert extract_text_from_pdf(resume).splitlines() == texts
+    assert len(pools) == 1
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from autoapply import scoring
+from autoapply.scoring import ResumeScorer
+
+
+def test_scorer_counts_clipped_token_overlap(make_job):
+    scorer = ResumeScorer("python python automation rust", skills=["python", "go"])
+
+    score = scorer.score(make_job(description="python automation automation", tags=["SQL"]))
+
+    assert score.keyword_overlap == pytest.approx(2 / 4)
+    assert score.skills_overlap == pytest.approx(1 / 2)
+    assert score.composite == pytest.approx(0.5 * 0.7 + 0.5 * 0.3)
+
+
+def test_score_batch_prefers_relevant_jobs(make_job):
+    scorer = ResumeScorer("python automation engineer", skills=["python"])
+    relevant = make_job(description="python automation testing")
+    unrelated = make_job(description="sales and marketing")
+
+    scores = scorer.score_batch([unrelated, relevant])
+
+    assert [score.job for score in scores] == [unrelated, relevant]
+    assert scores[1].composite > scores[0].composite
+    assert scores[1].skills_overlap == pytest.approx(1.0)
+
+
+def test_score_batch_does_not_depend_on_the_batch(make_job):
+    scorer = ResumeScorer("python automation engineer testing", skills=["python"])
+    job = make_job(description="python automation")
+    others = [
+        make_job(description=text)
+        for text in ("python sales", "automation automation", "marketing")
+    ]
+
+    alone = scorer.score_batch([job])[0]
+    together = scorer.score_batch([*others, job])[-1]
+
+    assert together.keyword_overlap == pytest.approx(alone.keyword_overlap)
+    assert together.composite == pytest.approx(alone.composite)
+
+
+def test_score_batch_matches_per_job_skills_overlap(make_job):
+    scorer = ResumeScorer("python automation", skills=["python", "go", "sql"])
+    jobs = [
+        make_job(description="python developer", tags=["SQL"]),
+        make_job(description="sales"),
+        make_job(description="go python sql"),
+    ]
+
+    batch = scorer.score_batch(jobs)
+
+    assert [score.skills_overlap for score in batch] == pytest.approx(
+        [scorer.score(job).skills_overlap for job in jobs]
+    )
+
+
+def test_score_batch_without_scikit_learn(make_job, monkeypatch):
+    monkeypatch.setattr(scoring, "_sklearn_available", lambda: False)
+    scorer = ResumeScorer("python automation", skills=["python"])
+    job = make_job(description="python developer")
+
+    assert scorer.score_batch([job]) == [scorer.score(job)]
+    assert scorer.metric.startswith("overlap-")
+
+
+def test_tokeniser_strips_punctuation_and_stop_words():
+    scorer = ResumeScorer("")
+
+    tokens = scorer._tokenise("Python, Node.js and C++ with the A team.")
+
+    assert tokens == ["python", "node.js", "c++", "team"]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from autoapply.job_sources.base import JobPosting
+from autoapply.scoring import JobScore
+from autoapply.scoring_cache import ScoreCache
+
+
+def _score(job: JobPosting, composite: float) -> JobScore:
+    return JobScore(job=job, skills_overlap=0.5, keyword_overlap=0.25, composite=composite)
+
+
+def test_score_cache_round_trip_is_scoped_by_resume(tmp_path, make_job):
+    cache = ScoreCache(tmp_path / "nested" / "scores.sqlite")
+    cache.put_many("resume-a", [_score(make_job("job-1"), 0.3), _score(make_job("job-2"), 0.6)])
+
+    assert cache.get_many("resume-a", ["job-1", "job-3"]) == {"job-1": (0.3, 0.25, 0.5)}
+    assert cache.get_many("resume-b", ["job-1"]) == {}
+    cache.close()
+
+    reopened = ScoreCache(tmp_path / "nested" / "scores.sqlite")
+    assert set(reopened.get_many("resume-a", ["job-1", "job-2"])) == {"job-1", "job-2"}
+    reopened.close()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from autoapply.agent import AutoApplyAgent
+from autoapply.config import AgentConfig, JobSearchPreferences, ResumeConfig, UserProfile
+from autoapply.retrieval.faiss_index import SemanticIndex
+
+_VOCAB = ["python", "automation", "sales", "marketing"]
+
+
+class FakeEncoder:
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts, batch_size, normalize_embeddings):
+        self.encoded.extend(texts)
+        vectors = np.array(
+            [[text.lower().count(word) for word in _VOCAB] for text in texts], dtype=np.float32
+        )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+
+def test_semantic_index_returns_nearest_postings_and_persists(tmp_path, make_job):
+    titles = ("Sales lead", "Python automation", "Marketing")
+    jobs = [make_job(str(number), title=title) for number, title in enumerate(titles, 1)]
+    index = SemanticIndex(cache_dir=tmp_path)
+    index._model = FakeEncoder()
+
+    assert [job.id for job in index.search("python automation", jobs, k=1)] == ["2"]
+    index.save()
+
+    reloaded = SemanticIndex(cache_dir=tmp_path)
+    encoder = reloaded._model = FakeEncoder()
+    results = reloaded.search("python", jobs[1:], k=5)
+
+    assert [job.id for job in results] == ["2", "3"]
+    assert encoder.encoded == ["python"]
+
+
+def test_semantic_index_evicts_least_recently_used_embeddings(tmp_path, make_job):
+    index = SemanticIndex(cache_dir=tmp_path, max_cached=2)
+    index._model = FakeEncoder()
+    index.search("python", [make_job("1"), make_job("2")])
+    index.search("python", [make_job("3"), make_job("1")])
+    index.save()
+
+    reloaded = SemanticIndex(cache_dir=tmp_path)
+
+    assert list(reloaded._vectors) == ["3", "1"]
+
+
+def test_rank_jobs_prefilters_only_the_jobs_it_is_given(tmp_path, make_job, monkeypatch):
+    monkeypatch.setattr("autoapply.agent.default_cache_dir", lambda: tmp_path)
+    resume = tmp_path / "resume.pdf"
+    resume.write_bytes(b"")
+    config = AgentConfig(
+        user=UserProfile(full_name="Alex Candidate", email="alex@example.com"),
+        resume=ResumeConfig(path=resume),
+        search=JobSearchPreferences(keywords=["python"]),
+    )
+    agent = AutoApplyAgent(config=config, job_sources=[], resume_text="python automation")
+    agent.semantic_prefilter_threshold = 1
+    agent.semantic_prefilter_k = 1
+    agent._semantic_index = SemanticIndex(cache_dir=tmp_path)
+    agent._semantic_index._model = FakeEncoder()
+    first = [make_job("a", title="Python automation"), make_job("b", title="Python")]
+    second = [make_job("c", title="Sales"), make_job("d", title="Python sales")]
+
+    assert [score.job.id for score in agent.rank_jobs(first)] == ["a"]
+    assert [score.job.id for score in agent.rank_jobs(second)] == ["d"]